@@ -4,12 +4,19 @@ Environment variables can be set in a .env file or directly in the environment.
 """
 import os
 from enum import Enum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Type, TypeVar
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+
+@lru_cache(maxsize=None)
+def _env() -> Dict[str, str]:
+    """Load the .env file once and return a snapshot of the process environment."""
+    load_dotenv()
+    return dict(os.environ)
+
 
 # Base paths
 ROOT_DIR = Path(__file__).parent.parent
@@ -18,10 +25,6 @@ REPORTS_DIR = ROOT_DIR / "reports"
 SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 DATA_DIR = ROOT_DIR / "tests" / "data"
 
-# Create directories if they don't exist
-REPORTS_DIR.mkdir(exist_ok=True)
-SCREENSHOTS_DIR.mkdir(exist_ok=True)
-
 
 class Environment(str, Enum):
     """Supported test environments."""
@@ -37,109 +40,126 @@ class Browser(str, Enum):
     WEBKIT = "webkit"
 
 
+E = TypeVar("E", bound=Enum)
+
+
+def _enum_member(enum_cls: Type[E], value: str) -> E:
+    """Look up an enum member by value without going through the Enum call machinery."""
+    try:
+        return enum_cls._value2member_map_[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
 # Environment settings
-CURRENT_ENV = Environment(os.getenv("TEST_ENV", Environment.DEV))
+CURRENT_ENV = _enum_member(Environment, _env().get("TEST_ENV", Environment.DEV.value))
 
-# URLs for different environments
-BASE_URLS: Dict[Environment, str] = {
-    Environment.DEV: os.getenv("DEV_URL", "https://dev-example.com"),
-    Environment.STAGING: os.getenv("STAGING_URL", "https://staging-example.com"),
-    Environment.PRODUCTION: os.getenv("PROD_URL", "https://example.com"),
+# Default URLs for different environments
+DEFAULT_BASE_URLS: Dict[Environment, str] = {
+    Environment.DEV: "https://dev-example.com",
+    Environment.STAGING: "https://staging-example.com",
+    Environment.PRODUCTION: "https://example.com",
 }
 
-# Current base URL based on environment
-BASE_URL = BASE_URLS[CURRENT_ENV]
 
-# Test user credentials
-TEST_USERS: Dict[Environment, Dict[str, Dict[str, str]]] = {
-    Environment.DEV: {
-        "admin": {
-            "email": os.getenv("DEV_ADMIN_EMAIL", "admin@example.com"),
-            "password": os.getenv("DEV_ADMIN_PASSWORD", "admin123"),
-        },
-        "standard": {
-            "email": os.getenv("DEV_USER_EMAIL", "user@example.com"),
-            "password": os.getenv("DEV_USER_PASSWORD", "user123"),
-        },
-    },
-    Environment.STAGING: {
-        "admin": {
-            "email": os.getenv("STAGING_ADMIN_EMAIL", "admin@example.com"),
-            "password": os.getenv("STAGING_ADMIN_PASSWORD", "admin123"),
-        },
-        "standard": {
-            "email": os.getenv("STAGING_USER_EMAIL", "user@example.com"),
-            "password": os.getenv("STAGING_USER_PASSWORD", "user123"),
-        },
-    },
-    Environment.PRODUCTION: {
+@lru_cache(maxsize=None)
+def _base_url_for(env: Environment) -> str:
+    """Get the base URL for an environment (e.g. from DEV_URL)."""
+    return _env().get(f"{env.value.upper()}_URL", DEFAULT_BASE_URLS[env])
+
+
+@lru_cache(maxsize=None)
+def _users_for(env: Environment) -> Mapping[str, Mapping[str, str]]:
+    """Get the test users for an environment (e.g. from DEV_ADMIN_EMAIL)."""
+    prefix = env.value.upper()
+    users = {
         "admin": {
-            "email": os.getenv("PROD_ADMIN_EMAIL", "admin@example.com"),
-            "password": os.getenv("PROD_ADMIN_PASSWORD", "admin123"),
+            "email": _env().get(f"{prefix}_ADMIN_EMAIL", "admin@example.com"),
+            "password": _env().get(f"{prefix}_ADMIN_PASSWORD", "admin123"),
         },
         "standard": {
-            "email": os.getenv("PROD_USER_EMAIL", "user@example.com"),
-            "password": os.getenv("PROD_USER_PASSWORD", "user123"),
+            "email": _env().get(f"{prefix}_USER_EMAIL", "user@example.com"),
+            "password": _env().get(f"{prefix}_USER_PASSWORD", "user123"),
         },
-    },
-}
+    }
+    # Freeze the users so cached lookups can share them without copying
+    return MappingProxyType(
+        {user_type: MappingProxyType(credentials) for user_type, credentials in users.items()}
+    )
+
+
+# Current base URL based on environment
+BASE_URL = _base_url_for(CURRENT_ENV)
 
 # Timeout settings (in milliseconds)
-DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
-NAVIGATION_TIMEOUT = int(os.getenv("NAVIGATION_TIMEOUT", "60000"))
+DEFAULT_TIMEOUT = int(_env().get("DEFAULT_TIMEOUT", "30000"))
+NAVIGATION_TIMEOUT = int(_env().get("NAVIGATION_TIMEOUT", "60000"))
 
 # Browser settings
-DEFAULT_BROWSER = Browser(os.getenv("DEFAULT_BROWSER", Browser.CHROMIUM))
-HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
-SLOW_MO = int(os.getenv("SLOW_MO", "0"))
+DEFAULT_BROWSER = _enum_member(Browser, _env().get("DEFAULT_BROWSER", Browser.CHROMIUM.value))
+HEADLESS = _env().get("HEADLESS", "true").lower() == "true"
+SLOW_MO = int(_env().get("SLOW_MO", "0"))
 VIEWPORT_SIZE = {
-    "width": int(os.getenv("VIEWPORT_WIDTH", "1280")),
-    "height": int(os.getenv("VIEWPORT_HEIGHT", "720")),
+    "width": int(_env().get("VIEWPORT_WIDTH", "1280")),
+    "height": int(_env().get("VIEWPORT_HEIGHT", "720")),
 }
+RECORD_VIDEO = _env().get("RECORD_VIDEO", "false").lower() == "true"
 
 # Test execution settings
-RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "2"))
-PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "4"))
+RETRY_ATTEMPTS = int(_env().get("RETRY_ATTEMPTS", "2"))
+PARALLEL_WORKERS = int(_env().get("PARALLEL_WORKERS", "4"))
 
 # API settings
-API_BASE_URL = os.getenv("API_BASE_URL", f"{BASE_URL}/api")
-API_TIMEOUT = int(os.getenv("API_TIMEOUT", "10000"))
+API_BASE_URL = _env().get("API_BASE_URL", f"{BASE_URL}/api")
+API_TIMEOUT = int(_env().get("API_TIMEOUT", "10000"))
 
 # Reporting settings
-ALLURE_RESULTS_DIR = os.getenv("ALLURE_RESULTS_DIR", "allure-results")
+ALLURE_RESULTS_DIR = _env().get("ALLURE_RESULTS_DIR", "allure-results")
+CAPTURE_LOGS = _env().get("CAPTURE_LOGS", "false").lower() == "true"
+NETWORK_LOG_LIMIT = int(_env().get("NETWORK_LOG_LIMIT", "500"))
+ARTIFACT_HTML_MAX_BYTES = int(_env().get("ARTIFACT_HTML_MAX_BYTES", "524288"))
+
+# Test management settings
+TESTRAIL_URL = _env().get("TESTRAIL_URL")
+TESTRAIL_RUN_ID = _env().get("TESTRAIL_RUN_ID")
 
 
-def get_browser_options(browser_name: Browser) -> Dict[str, Any]:
-    """Get browser-specific options."""
+@lru_cache(maxsize=None)
+def get_browser_options(browser_name: Browser) -> Mapping[str, Any]:
+    """Get browser-specific options as a read-only mapping."""
     common_options = {
         "headless": HEADLESS,
         "slow_mo": SLOW_MO,
-        "viewport": VIEWPORT_SIZE,
+        "viewport": MappingProxyType(dict(VIEWPORT_SIZE)),
     }
     
     browser_specific: Dict[Browser, Dict[str, Any]] = {
         Browser.CHROMIUM: {
-            "args": ["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"],
+            "args": ("--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"),
         },
         Browser.FIREFOX: {},
         Browser.WEBKIT: {},
     }
     
-    return {**common_options, **browser_specific.get(browser_name, {})}
+    # The options are cached and shared by every caller, so freeze them
+    return MappingProxyType({**common_options, **browser_specific.get(browser_name, {})})
 
 
-def get_env_config() -> Dict[str, Any]:
-    """Get current environment configuration."""
-    return {
+@lru_cache(maxsize=None)
+def get_env_config() -> Mapping[str, Any]:
+    """Get current environment configuration as a read-only mapping."""
+    # The configuration is cached and shared by every caller, so freeze it
+    return MappingProxyType({
         "environment": CURRENT_ENV,
         "base_url": BASE_URL,
-        "users": TEST_USERS[CURRENT_ENV],
+        "users": _users_for(CURRENT_ENV),
         "timeout": DEFAULT_TIMEOUT,
         "browser": DEFAULT_BROWSER,
         "headless": HEADLESS,
-    }
+    })
 
 
-def get_user_credentials(user_type: str) -> Dict[str, str]:
+@lru_cache(maxsize=None)
+def get_user_credentials(user_type: str) -> Mapping[str, str]:
     """Get user credentials for the current environment."""
-    return TEST_USERS[CURRENT_ENV].get(user_type, {}) 
\ No newline at end of file
+    return _users_for(CURRENT_ENV).get(user_type, MappingProxyType({})) 
\ No newline at end of file
@@ -3,7 +3,7 @@ Base Page Object Model that provides common functionality for all pages.
 """
 from typing import Any, Dict, List, Optional, Union
 
-from playwright.sync_api import Page, Locator, expect
+from playwright.sync_api import Page, Locator
 
 from config import settings
 from utils.helpers import wait_for_navigation, take_screenshot
@@ -12,6 +12,8 @@ from utils.helpers import wait_for_navigation, take_screenshot
 class BasePage:
     """Base class for all Page Objects."""
     
+    __slots__ = ("page", "timeout", "url", "_locators", "_locator", "_keyboard_press")
+    
     def __init__(self, page: Page):
         """
         Initialize BasePage with a Playwright page.
@@ -22,6 +24,11 @@ class BasePage:
         self.page = page
         self.timeout = settings.DEFAULT_TIMEOUT
         self.url = settings.BASE_URL
+        self._locators: Dict[str, Locator] = {}
+        
+        # Bind the most frequently used page methods once
+        self._locator = page.locator
+        self._keyboard_press = page.keyboard.press
     
     def navigate(self, path: str = "") -> None:
         """
@@ -44,11 +51,11 @@ class BasePage:
         Returns:
             Playwright Locator object
         """
-        return self.page.locator(f"[data-testid='{test_id}']")
+        return self.page.get_by_test_id(test_id)
     
     def get_element(self, selector: str) -> Locator:
         """
-        Get element by CSS selector.
+        Get element by CSS selector, reusing the Locator for repeated selectors.
         
         Args:
             selector: CSS selector
@@ -56,7 +63,10 @@ class BasePage:
         Returns:
             Playwright Locator object
         """
-        return self.page.locator(selector)
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self._locator(selector)
+        return locator
     
     def click(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> None:
         """
@@ -67,7 +77,7 @@ class BasePage:
             timeout: Custom timeout in milliseconds (optional)
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         locator.click(timeout=timeout)
     
     def type_text(self, selector: Union[str, Locator], text: str, timeout: Optional[int] = None) -> None:
@@ -80,7 +90,7 @@ class BasePage:
             timeout: Custom timeout in milliseconds (optional)
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         locator.fill(text, timeout=timeout)
     
     def get_text(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> str:
@@ -95,7 +105,7 @@ class BasePage:
             Text content of the element
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return locator.text_content(timeout=timeout) or ""
     
     def is_visible(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> bool:
@@ -110,7 +120,7 @@ class BasePage:
             True if the element is visible, False otherwise
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return locator.is_visible(timeout=timeout)
     
     def wait_for_element(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> Locator:
@@ -125,8 +135,8 @@ class BasePage:
             Playwright Locator object
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
-        expect(locator).to_be_visible(timeout=timeout)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
+        locator.wait_for(state="visible", timeout=timeout)
         return locator
     
     def wait_for_element_to_be_hidden(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> None:
@@ -138,8 +148,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds (optional)
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
-        expect(locator).to_be_hidden(timeout=timeout)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
+        locator.wait_for(state="hidden", timeout=timeout)
     
     def wait_for_url(self, url_pattern: str, timeout: Optional[int] = None) -> None:
         """
@@ -162,7 +172,7 @@ class BasePage:
             timeout: Custom timeout in milliseconds (optional)
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         locator.select_option(value, timeout=timeout)
     
     def take_screenshot(self, name: Optional[str] = None) -> str:
@@ -187,7 +197,7 @@ class BasePage:
         Returns:
             List of text content of all matching elements
         """
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return [text or "" for text in locator.all_text_contents()]
     
     def get_attribute(self, selector: Union[str, Locator], attribute: str, timeout: Optional[int] = None) -> Optional[str]:
@@ -203,7 +213,7 @@ class BasePage:
             Attribute value or None if not found
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return locator.get_attribute(attribute, timeout=timeout)
     
     def wait_for_network_idle(self, timeout: Optional[int] = None) -> None:
@@ -228,7 +238,7 @@ class BasePage:
             True if the element is enabled, False otherwise
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return locator.is_enabled(timeout=timeout)
         
     def hover(self, selector: Union[str, Locator], timeout: Optional[int] = None) -> None:
@@ -240,7 +250,7 @@ class BasePage:
             timeout: Custom timeout in milliseconds (optional)
         """
         timeout = timeout or self.timeout
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         locator.hover(timeout=timeout)
         
     def get_count(self, selector: Union[str, Locator]) -> int:
@@ -253,7 +263,7 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        locator = selector if isinstance(selector, Locator) else self.page.locator(selector)
+        locator = selector if isinstance(selector, Locator) else self.get_element(selector)
         return locator.count()
         
     def press_key(self, key: str) -> None:
@@ -263,4 +273,4 @@ class BasePage:
         Args:
             key: Key to press (e.g., 'Enter', 'Escape')
         """
-        self.page.keyboard.press(key) 
\ No newline at end of file
+        self._keyboard_press(key) 
\ No newline at end of file
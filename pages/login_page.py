@@ -1,17 +1,63 @@
 """
 Login Page Object Model.
 """
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from config import settings
 from pages.base_page import BasePage
 
+# BASE_URL is fixed for the run, so build the login URL once
+_LOGIN_URL = f"{settings.BASE_URL}/login"
+
+# Checks visibility of several selectors in the browser with a single round-trip
+_VISIBILITY_SCRIPT = """(selectors) => Object.fromEntries(
+    Object.entries(selectors).map(([name, selector]) => {
+        const element = document.querySelector(selector);
+        const visible = !!element
+            && element.getClientRects().length > 0
+            && getComputedStyle(element).visibility !== "hidden";
+        return [name, visible];
+    })
+)"""
+
 
 class LoginPage(BasePage):
     """Page object for the login page."""
     
+    __slots__ = (
+        "email_input",
+        "password_input",
+        "login_button",
+        "remember_me_checkbox",
+        "forgot_password_link",
+        "error_message",
+        "success_message",
+    )
+    
+    # Selectors
+    EMAIL_INPUT: ClassVar[str] = "[data-testid='email-input']"
+    PASSWORD_INPUT: ClassVar[str] = "[data-testid='password-input']"
+    LOGIN_BUTTON: ClassVar[str] = "[data-testid='login-button']"
+    REMEMBER_ME_CHECKBOX: ClassVar[str] = "[data-testid='remember-me']"
+    FORGOT_PASSWORD_LINK: ClassVar[str] = "[data-testid='forgot-password']"
+    FORGOT_PASSWORD_EMAIL_INPUT: ClassVar[str] = "[data-testid='forgot-password-email']"
+    FORGOT_PASSWORD_SUBMIT: ClassVar[str] = "[data-testid='forgot-password-submit']"
+    ERROR_MESSAGE: ClassVar[str] = ".error-message"
+    SUCCESS_MESSAGE: ClassVar[str] = ".success-message"
+    
+    # Where a successful login lands
+    DASHBOARD_PATH: ClassVar[str] = "/dashboard"
+    DASHBOARD_URL: ClassVar[str] = f"**{DASHBOARD_PATH}"
+    
+    # How long to wait for the redirect after submitting the login form (in milliseconds)
+    REDIRECT_TIMEOUT: ClassVar[int] = 5000
+    
+    # How long to wait for an error/success message before assuming there is none (in milliseconds)
+    MESSAGE_TIMEOUT: ClassVar[int] = 1000
+    
     def __init__(self, page: Page):
         """
         Initialize LoginPage with a Playwright page.
@@ -20,22 +66,23 @@ class LoginPage(BasePage):
             page: Playwright page object
         """
         super().__init__(page)
-        self.url = f"{settings.BASE_URL}/login"
-        
-        # Selectors
-        self.email_input = "[data-testid='email-input']"
-        self.password_input = "[data-testid='password-input']"
-        self.login_button = "[data-testid='login-button']"
-        self.remember_me_checkbox = "[data-testid='remember-me']"
-        self.forgot_password_link = "[data-testid='forgot-password']"
-        self.error_message = ".error-message"
-        self.success_message = ".success-message"
+        self.url = _LOGIN_URL
+        
+        # Locators
+        self.email_input = page.locator(self.EMAIL_INPUT)
+        self.password_input = page.locator(self.PASSWORD_INPUT)
+        self.login_button = page.locator(self.LOGIN_BUTTON)
+        self.remember_me_checkbox = page.locator(self.REMEMBER_ME_CHECKBOX)
+        self.forgot_password_link = page.locator(self.FORGOT_PASSWORD_LINK)
+        # Only match displayed messages, so hidden placeholders read as no message
+        self.error_message = page.locator(f"{self.ERROR_MESSAGE}:visible")
+        self.success_message = page.locator(f"{self.SUCCESS_MESSAGE}:visible")
         
     def navigate_to_login(self) -> None:
         """Navigate to the login page."""
         self.navigate()
         
-    def login(self, email: str, password: str, remember_me: bool = False) -> None:
+    def login(self, email: str, password: str, remember_me: bool = False, wait_for_url: Optional[str] = None) -> None:
         """
         Login with the provided credentials.
         
@@ -43,28 +90,42 @@ class LoginPage(BasePage):
             email: User email
             password: User password
             remember_me: Whether to check the remember me checkbox (default: False)
+            wait_for_url: URL pattern the login submit is expected to navigate to (optional)
         """
         self.type_text(self.email_input, email)
         self.type_text(self.password_input, password)
         
         if remember_me:
             self.click(self.remember_me_checkbox)
-            
+        
         self.click(self.login_button)
+        
+        if wait_for_url:
+            # Returns as soon as the URL matches, even if the redirect already happened
+            try:
+                self.page.wait_for_url(wait_for_url, timeout=self.REDIRECT_TIMEOUT)
+            except PlaywrightTimeoutError:
+                # A failed login stays on the page; callers check is_logged_in() for the outcome
+                pass
         self.wait_for_network_idle()
         
-    def login_as_user(self, user_type: str = "standard") -> None:
+    def login_as_user(self, user_type: str = "standard", wait_for_dashboard: bool = False) -> None:
         """
         Login as a predefined user type.
         
         Args:
             user_type: Type of user ("admin" or "standard", default: "standard")
+            wait_for_dashboard: Whether to wait for the redirect to the dashboard (default: False)
         """
         credentials = settings.get_user_credentials(user_type)
         if not credentials:
             raise ValueError(f"No credentials found for user type: {user_type}")
             
-        self.login(credentials["email"], credentials["password"])
+        self.login(
+            credentials["email"],
+            credentials["password"],
+            wait_for_url=self.DASHBOARD_URL if wait_for_dashboard else None,
+        )
         
     def forgot_password(self, email: str) -> None:
         """
@@ -75,9 +136,9 @@ class LoginPage(BasePage):
         """
         self.click(self.forgot_password_link)
         # Wait for forgot password form to appear
-        self.wait_for_element("[data-testid='forgot-password-email']")
-        self.type_text("[data-testid='forgot-password-email']", email)
-        self.click("[data-testid='forgot-password-submit']")
+        self.wait_for_element(self.FORGOT_PASSWORD_EMAIL_INPUT)
+        self.type_text(self.FORGOT_PASSWORD_EMAIL_INPUT, email)
+        self.click(self.FORGOT_PASSWORD_SUBMIT)
         
     def get_error_message(self) -> str:
         """
@@ -86,9 +147,10 @@ class LoginPage(BasePage):
         Returns:
             Error message text
         """
-        if self.is_visible(self.error_message):
-            return self.get_text(self.error_message)
-        return ""
+        try:
+            return self.error_message.text_content(timeout=self.MESSAGE_TIMEOUT) or ""
+        except PlaywrightTimeoutError:
+            return ""
         
     def get_success_message(self) -> str:
         """
@@ -97,9 +159,10 @@ class LoginPage(BasePage):
         Returns:
             Success message text
         """
-        if self.is_visible(self.success_message):
-            return self.get_text(self.success_message)
-        return ""
+        try:
+            return self.success_message.text_content(timeout=self.MESSAGE_TIMEOUT) or ""
+        except PlaywrightTimeoutError:
+            return ""
         
     def is_logged_in(self) -> bool:
         """
@@ -109,11 +172,7 @@ class LoginPage(BasePage):
             True if the user is logged in, False otherwise
         """
         # After successful login, we're redirected to the dashboard
-        try:
-            self.page.wait_for_url("**/dashboard", timeout=5000)
-            return True
-        except:
-            return False
+        return self.DASHBOARD_PATH in self.page.url
             
     def validate_login_form(self) -> Dict[str, bool]:
         """
@@ -122,10 +181,13 @@ class LoginPage(BasePage):
         Returns:
             Dictionary indicating presence of each form element
         """
-        return {
-            "email_input": self.is_visible(self.email_input),
-            "password_input": self.is_visible(self.password_input),
-            "login_button": self.is_visible(self.login_button),
-            "remember_me_checkbox": self.is_visible(self.remember_me_checkbox),
-            "forgot_password_link": self.is_visible(self.forgot_password_link),
-        } 
\ No newline at end of file
+        return self.page.evaluate(
+            _VISIBILITY_SCRIPT,
+            {
+                "email_input": self.EMAIL_INPUT,
+                "password_input": self.PASSWORD_INPUT,
+                "login_button": self.LOGIN_BUTTON,
+                "remember_me_checkbox": self.REMEMBER_ME_CHECKBOX,
+                "forgot_password_link": self.FORGOT_PASSWORD_LINK,
+            },
+        ) 
\ No newline at end of file
@@ -1,20 +1,24 @@
 """
 Pytest configuration and fixtures.
+
+Playwright, the page objects and the reporting utilities are imported inside
+the fixtures and hooks that use them, so collection-only runs don't load them.
 """
-import os
-import pytest
-from typing import Any, Dict, Generator, Optional
+from __future__ import annotations
 
-from playwright.sync_api import Browser as PlaywrightBrowser
-from playwright.sync_api import BrowserContext, Page, Playwright, sync_playwright
+import warnings
+
+import pytest
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Optional
 
 from config import settings
-from pages.login_page import LoginPage
-from utils.reporting import (
-    save_test_artifacts,
-    create_allure_environment_properties,
-    TestLogCollector,
-)
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser as PlaywrightBrowser
+    from playwright.sync_api import BrowserContext, Page, Playwright
+
+    from pages.login_page import LoginPage
+    from utils.test_management import TestRailClient
 
 
 def pytest_addoption(parser):
@@ -60,14 +64,15 @@ def slow_mo(request) -> int:
 @pytest.fixture(scope="session")
 def browser_type(playwright: Playwright, browser_name: str) -> PlaywrightBrowser:
     """Get the browser type from Playwright."""
-    if browser_name.lower() == "chromium":
-        return playwright.chromium
-    elif browser_name.lower() == "firefox":
-        return playwright.firefox
-    elif browser_name.lower() == "webkit":
-        return playwright.webkit
-    else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
+    browser_types = {
+        settings.Browser.CHROMIUM: playwright.chromium,
+        settings.Browser.FIREFOX: playwright.firefox,
+        settings.Browser.WEBKIT: playwright.webkit,
+    }
+    try:
+        return browser_types[browser_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported browser: {browser_name}") from None
 
 
 @pytest.fixture(scope="session")
@@ -78,7 +83,7 @@ def browser_context_args(headed: bool, slow_mo: int) -> Dict[str, Any]:
         "viewport": settings.VIEWPORT_SIZE,
         "headless": not headed,
         "slow_mo": slow_mo,
-        "record_video_dir": "videos/" if os.getenv("RECORD_VIDEO", "false").lower() == "true" else None,
+        "record_video_dir": "videos/" if settings.RECORD_VIDEO else None,
     }
 
 
@@ -93,49 +98,105 @@ def browser(browser_type: PlaywrightBrowser, browser_context_args: Dict[str, Any
 @pytest.fixture
 def context(browser: PlaywrightBrowser, browser_context_args: Dict[str, Any]) -> Generator[BrowserContext, None, None]:
     """Create a new browser context for each test."""
+    # The browser is shared by the session; a fresh context is cheap and isolates
+    # cookies and storage of every origin a test visits
     context_instance = browser.new_context(**browser_context_args)
     yield context_instance
     context_instance.close()
 
 
-@pytest.fixture
-def page(context: BrowserContext) -> Generator[Page, None, None]:
-    """Create a new page for each test."""
-    page_instance = context.new_page()
+def _attach_log_collectors(page_instance: Page) -> None:
+    """Attach console and network log collectors to a page when CAPTURE_LOGS is set."""
+    # Event listeners cost a round-trip per event, so only attach them when logs are wanted
+    if not settings.CAPTURE_LOGS:
+        return
+    
+    from utils.reporting import NetworkLog, TestLogCollector
     
     # Setup page event listeners for logging
     log_collector = TestLogCollector()
     
     # Track console messages
-    page_instance._console_messages = []
-    page_instance.on("console", lambda msg: log_collector.add_console_log(f"[{msg.type}] {msg.text}"))
+    page_instance.on("console", log_collector.on_console)
     
-    # Track network requests
-    page_instance._network_requests = []
-    page_instance.on("request", lambda request: page_instance._network_requests.append(request))
+    # Track the most recent network requests with their responses
+    network_log = NetworkLog(maxlen=settings.NETWORK_LOG_LIMIT)
+    page_instance.on("response", network_log.on_response)
+    page_instance.on("requestfailed", network_log.on_request_failed)
+    page_instance._network_log = network_log
     
     # Set the log collector on the page for later access
     page_instance._log_collector = log_collector
-    
+
+
+@pytest.fixture
+def page(context: BrowserContext) -> Generator[Page, None, None]:
+    """Create a new page for each test."""
+    page_instance = context.new_page()
+    _attach_log_collectors(page_instance)
     yield page_instance
     
 
 @pytest.fixture
 def login_page(page: Page) -> LoginPage:
     """Create a login page instance."""
+    from pages.login_page import LoginPage
+    
     return LoginPage(page)
 
 
+def _login_storage_state(browser: PlaywrightBrowser, browser_context_args: Dict[str, Any], user_type: str) -> Dict[str, Any]:
+    """Log in through the UI in a throwaway context and capture its storage state."""
+    from pages.login_page import LoginPage
+    
+    context_instance = browser.new_context(**browser_context_args)
+    try:
+        user_login_page = LoginPage(context_instance.new_page())
+        user_login_page.navigate_to_login()
+        user_login_page.login_as_user(user_type, wait_for_dashboard=True)
+        
+        # Check if login was successful
+        assert user_login_page.is_logged_in(), f"Login failed for {user_type} user"
+        
+        return context_instance.storage_state()
+    finally:
+        context_instance.close()
+
+
+@pytest.fixture(scope="session")
+def admin_storage_state(browser: PlaywrightBrowser, browser_context_args: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the storage state of a logged-in admin user."""
+    return _login_storage_state(browser, browser_context_args, "admin")
+
+
+@pytest.fixture(scope="session")
+def standard_storage_state(browser: PlaywrightBrowser, browser_context_args: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the storage state of a logged-in standard user."""
+    return _login_storage_state(browser, browser_context_args, "standard")
+
+
 @pytest.fixture
-def authenticated_page(login_page: LoginPage) -> Page:
-    """Get an authenticated page."""
-    login_page.navigate_to_login()
-    login_page.login_as_user("standard")
+def authenticated_page(request, browser: PlaywrightBrowser, browser_context_args: Dict[str, Any]) -> Generator[Callable[..., Page], None, None]:
+    """Get a factory that opens a page already logged in as the given user type."""
+    contexts = []
+    request.node._authenticated_pages = []
     
-    # Check if login was successful
-    assert login_page.is_logged_in(), "Login failed"
+    def _open(user_type: str = "standard") -> Page:
+        # Storage states are session fixtures, so each user type logs in through the UI only once
+        storage_state = request.getfixturevalue(f"{user_type}_storage_state")
+        context_instance = browser.new_context(storage_state=storage_state, **browser_context_args)
+        contexts.append(context_instance)
+        
+        page_instance = context_instance.new_page()
+        _attach_log_collectors(page_instance)
+        # Let pytest_runtest_makereport save failure artifacts for the pages opened here
+        request.node._authenticated_pages.append(page_instance)
+        return page_instance
+    
+    yield _open
     
-    return login_page.page
+    for context_instance in contexts:
+        context_instance.close()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -154,21 +215,24 @@ def pytest_runtest_makereport(item, call):
     
     # Only handle failures after the test runs ("call" phase)
     if rep.when == "call" and rep.failed:
-        # Get the page fixture if available
-        page = None
-        for fixture_name in item._fixtureinfo.name2fixturedefs:
-            if fixture_name == "page" and hasattr(item, "funcargs") and "page" in item.funcargs:
-                page = item.funcargs["page"]
-                break
+        # Get the page fixture if available, otherwise the pages opened by authenticated_page
+        funcargs = getattr(item, "funcargs", {})
+        if "page" in funcargs:
+            pages = [funcargs["page"]]
+        else:
+            pages = getattr(item, "_authenticated_pages", [])
         
-        # If we have a page, save artifacts
-        if page:
-            try:
-                test_info = getattr(item, "_testinfo", None)
-                if test_info:
-                    save_test_artifacts(page, test_info)
-            except Exception as e:
-                print(f"Error saving test artifacts: {str(e)}")
+        # If we have pages, save artifacts
+        if pages:
+            from utils.reporting import save_test_artifacts
+            
+            for page in pages:
+                try:
+                    test_info = getattr(item, "_testinfo", None)
+                    if test_info:
+                        save_test_artifacts(page, test_info)
+                except Exception as e:
+                    print(f"Error saving test artifacts: {str(e)}")
 
     # Get test case ID if available
     test_id = None
@@ -176,50 +240,109 @@ def pytest_runtest_makereport(item, call):
         test_id = marker.args[0]
         break
     
-    # If we have a test ID and test has finished running
+    # Keep the test case ID on the report so pytest_runtest_logreport can report the result
     if test_id and rep.when == "call":
-        # You could add logic here to report results to your test management system
-        if hasattr(item.config, "workerinput"):  # Running in xdist worker
-            # Handle distributed test execution
-            pass
-        else:
-            # Report directly
-            status = "passed" if rep.passed else "failed"
-            # You could call your test management API here
+        rep.testrail_case_id = test_id
+
+
+class _TestRailReporter:
+    """Queue the final result of each test case and send them to TestRail at session end."""
+    
+    def __init__(self, client: TestRailClient):
+        self.client = client
+    
+    def pytest_runtest_logreport(self, report):
+        # Attempts that pytest-rerunfailures retries are reported with the outcome "rerun",
+        # so only the last attempt of a test is queued
+        if report.when != "call" or report.outcome not in ("passed", "failed"):
+            return
+        
+        # Under xdist the reports, including the case ID, are forwarded to the
+        # controller, which is the only process this reporter is registered in
+        test_id = getattr(report, "testrail_case_id", None)
+        if test_id is None:
+            return
+        
+        self.client.update_test_result(
+            test_id,
+            report.outcome,
+            message=report.longreprtext if report.failed else None,
+            elapsed=round(report.duration),
+        )
+    
+    def pytest_sessionfinish(self, session):
+        if self.client.skipped_ids:
+            warnings.warn(
+                "Not reporting tests with these IDs to TestRail, case IDs must look like "
+                f"'C1234' or '1234': {', '.join(sorted(self.client.skipped_ids))}"
+            )
+        
+        if not settings.TESTRAIL_RUN_ID:
+            if self.client.pending:
+                warnings.warn(
+                    f"TESTRAIL_URL is set but TESTRAIL_RUN_ID is not, so {self.client.pending} "
+                    "test results were not sent to TestRail"
+                )
+            return
+        
+        import requests
+        
+        # Reporting problems must not fail a run whose tests passed
+        try:
+            self.client.flush(settings.TESTRAIL_RUN_ID)
+        except requests.RequestException as e:
+            warnings.warn(f"Could not send test results to TestRail: {e}")
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_allure_environment():
-    """Set up Allure environment properties at the start of the test run."""
+    """Set up report directories and Allure environment properties at the start of the test run."""
+    from utils.reporting import create_allure_environment_properties
+    
+    settings.REPORTS_DIR.mkdir(exist_ok=True)
+    settings.SCREENSHOTS_DIR.mkdir(exist_ok=True, parents=True)
     create_allure_environment_properties()
 
 
 @pytest.fixture
-def login_as_admin(login_page: LoginPage) -> Page:
-    """Login as an admin user."""
-    login_page.navigate_to_login()
-    login_page.login_as_user("admin")
-    
-    # Check if login was successful
-    assert login_page.is_logged_in(), "Admin login failed"
+def login_as_admin(login_page: LoginPage) -> Callable[[], Page]:
+    """Get a factory that logs in as an admin user."""
+    def _login() -> Page:
+        login_page.navigate_to_login()
+        login_page.login_as_user("admin", wait_for_dashboard=True)
+        
+        # Check if login was successful
+        assert login_page.is_logged_in(), "Admin login failed"
+        
+        return login_page.page
     
-    return login_page.page
+    return _login
 
 
 @pytest.fixture
-def login_as_standard_user(login_page: LoginPage) -> Page:
-    """Login as a standard user."""
-    login_page.navigate_to_login()
-    login_page.login_as_user("standard")
-    
-    # Check if login was successful
-    assert login_page.is_logged_in(), "Standard user login failed"
+def login_as_standard_user(login_page: LoginPage) -> Callable[[], Page]:
+    """Get a factory that logs in as a standard user."""
+    def _login() -> Page:
+        login_page.navigate_to_login()
+        login_page.login_as_user("standard", wait_for_dashboard=True)
+        
+        # Check if login was successful
+        assert login_page.is_logged_in(), "Standard user login failed"
+        
+        return login_page.page
     
-    return login_page.page
+    return _login
 
 
 # Add a custom marker for test case IDs
 def pytest_configure(config):
     config.addinivalue_line(
         "markers", "tcid(id): mark test with test case ID for traceability"
-    ) 
\ No newline at end of file
+    )
+    
+    # Results are reported to TestRail only when TESTRAIL_URL is set. xdist workers
+    # forward their reports to the controller, so only the controller reports them
+    if settings.TESTRAIL_URL and not hasattr(config, "workerinput"):
+        from utils.test_management import TestRailClient
+        
+        config.pluginmanager.register(_TestRailReporter(TestRailClient()), "testrail_reporter") 
\ No newline at end of file
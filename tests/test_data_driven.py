@@ -4,42 +4,65 @@ Example of data-driven tests using test data files.
 import csv
 import json
 import pytest
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple
 
 from playwright.sync_api import Page, expect
 
 from config import settings
 from pages.login_page import LoginPage
+from utils.helpers import contains_ci, load_json_data
 
 
+class LoginScenario(NamedTuple):
+    """A row of the login scenarios CSV file."""
+    email: str
+    password: str
+    expected_result: str
+    error_message: str
+
+
+@lru_cache(maxsize=1)
 def load_user_data() -> Dict[str, Any]:
     """Load user data from JSON file."""
-    file_path = settings.DATA_DIR / "test_users.json"
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_data(settings.DATA_DIR / "test_users.json")
 
 
-def load_login_scenarios() -> List[Dict[str, str]]:
+@lru_cache(maxsize=1)
+def load_login_scenarios() -> List[LoginScenario]:
     """Load login test scenarios from CSV file."""
     file_path = settings.DATA_DIR / "login_scenarios.csv"
     with open(file_path, 'r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+        reader = csv.reader(f)
+        header = next(reader)
+        if tuple(header) != LoginScenario._fields:
+            raise ValueError(f"Unexpected columns in {file_path.name}: {header}")
+        return [LoginScenario(*row) for row in reader]
+
+
+@pytest.fixture(scope="session")
+def user_data() -> Dict[str, Any]:
+    """User data from the JSON file, parsed once per session."""
+    return load_user_data()
+
+
+# Loaded at collection time so each scenario becomes its own test
+_SCENARIOS = load_login_scenarios()
 
 
 @pytest.mark.ui
 @pytest.mark.parametrize("user_type", ["standard", "admin", "premium"])
-def test_login_with_valid_users(login_page: LoginPage, user_type: str):
+def test_login_with_valid_users(login_page: LoginPage, user_data: Dict[str, Any], user_type: str):
     """Test login with different types of valid users from JSON data."""
-    # Load user data
-    user_data = load_user_data()["valid_users"][user_type]
+    # Get user data
+    user = user_data["valid_users"][user_type]
     
     # Navigate to login page
     login_page.navigate_to_login()
     
     # Login with the user data
-    login_page.login(user_data["email"], user_data["password"])
+    login_page.login(user["email"], user["password"], wait_for_url=login_page.DASHBOARD_URL)
     
     # Verify successful login
     assert login_page.is_logged_in(), f"Login failed for {user_type} user"
@@ -47,16 +70,16 @@ def test_login_with_valid_users(login_page: LoginPage, user_type: str):
 
 @pytest.mark.ui
 @pytest.mark.parametrize("user_type", ["wrong_password", "nonexistent", "locked_out"])
-def test_login_with_invalid_users(login_page: LoginPage, user_type: str):
+def test_login_with_invalid_users(login_page: LoginPage, user_data: Dict[str, Any], user_type: str):
     """Test login with different types of invalid users from JSON data."""
-    # Load user data
-    user_data = load_user_data()["invalid_users"][user_type]
+    # Get user data
+    user = user_data["invalid_users"][user_type]
     
     # Navigate to login page
     login_page.navigate_to_login()
     
     # Login with the user data
-    login_page.login(user_data["email"], user_data["password"])
+    login_page.login(user["email"], user["password"])
     
     # Verify login failed
     assert not login_page.is_logged_in(), f"Login should have failed for {user_type} user"
@@ -67,38 +90,44 @@ def test_login_with_invalid_users(login_page: LoginPage, user_type: str):
 
 
 @pytest.mark.ui
-def test_login_with_csv_scenarios(login_page: LoginPage):
-    """Test login with scenarios from CSV file."""
-    # Load login scenarios
-    scenarios = load_login_scenarios()
+@pytest.mark.parametrize(
+    "scenario",
+    _SCENARIOS,
+    ids=[f"{scenario.email or 'no-email'}-{scenario.expected_result}" for scenario in _SCENARIOS],
+)
+def test_login_with_csv_scenarios(login_page: LoginPage, scenario: LoginScenario):
+    """Test login with a scenario from CSV file."""
+    # Navigate to login page
+    login_page.navigate_to_login()
     
-    for scenario in scenarios:
-        # Navigate to login page
-        login_page.navigate_to_login()
-        
-        # Login with scenario data
-        login_page.login(scenario["email"], scenario["password"])
+    # Login with scenario data, waiting for the dashboard only when the login should succeed
+    expects_success = scenario.expected_result == "success"
+    login_page.login(
+        scenario.email,
+        scenario.password,
+        wait_for_url=login_page.DASHBOARD_URL if expects_success else None,
+    )
+    
+    # Verify result based on expected_result
+    if expects_success:
+        assert login_page.is_logged_in(), \
+            f"Login should have succeeded for email={scenario.email}"
+    else:
+        assert not login_page.is_logged_in(), \
+            f"Login should have failed for email={scenario.email}"
         
-        # Verify result based on expected_result
-        if scenario["expected_result"] == "success":
-            assert login_page.is_logged_in(), \
-                f"Login should have succeeded for email={scenario['email']}"
-        else:
-            assert not login_page.is_logged_in(), \
-                f"Login should have failed for email={scenario['email']}"
-            
-            # Verify error message if specified
-            if scenario["error_message"]:
-                error_message = login_page.get_error_message()
-                assert scenario["error_message"].lower() in error_message.lower(), \
-                    f"Expected '{scenario['error_message']}' in error message, but got: '{error_message}'"
+        # Verify error message if specified
+        if scenario.error_message:
+            error_message = login_page.get_error_message()
+            assert contains_ci(error_message, scenario.error_message), \
+                f"Expected '{scenario.error_message}' in error message, but got: '{error_message}'"
 
 
 @pytest.mark.ui
-def test_registration_form_with_test_data(page: Page):
+def test_registration_form_with_test_data(page: Page, user_data: Dict[str, Any]):
     """Test filling a registration form with data from JSON file."""
-    # Load registration form data
-    form_data = load_user_data()["form_data"]["registration"]
+    # Get registration form data
+    form_data = user_data["form_data"]["registration"]
     
     # Navigate to registration page (mock)
     page.goto("https://example.com/register")
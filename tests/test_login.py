@@ -5,10 +5,14 @@ import pytest
 import allure
 from playwright.sync_api import Page, expect
 
-from utils.helpers import generate_random_email
+from config import settings
+from utils.helpers import contains_ci, generate_random_email
 from pages.login_page import LoginPage
 from utils.test_decorators import test_case
 
+# Common names of the cookie that keeps a user logged in
+SESSION_COOKIE_NAMES = ("session", "sessionid", "sid")
+
 
 @pytest.mark.ui
 @pytest.mark.smoke
@@ -37,7 +41,7 @@ class TestLogin:
         login_page.navigate_to_login()
         
         # Login as standard user
-        login_page.login_as_user("standard")
+        login_page.login_as_user("standard", wait_for_dashboard=True)
         
         # Verify successful login
         assert login_page.is_logged_in(), "Login was not successful"
@@ -54,7 +58,7 @@ class TestLogin:
         # Verify error message is displayed
         error_message = login_page.get_error_message()
         assert error_message, "No error message displayed for invalid credentials"
-        assert "Invalid email or password" in error_message or "incorrect" in error_message.lower(), \
+        assert contains_ci(error_message, ("Invalid email or password", "incorrect")), \
             f"Unexpected error message: {error_message}"
         
         # Verify we're still on the login page
@@ -72,7 +76,8 @@ class TestLogin:
         # Verify success message
         success_message = login_page.get_success_message()
         assert success_message, "No success message displayed for forgot password"
-        assert "email" in success_message.lower() and "sent" in success_message.lower(), \
+        message = success_message.lower()
+        assert "email" in message and "sent" in message, \
             f"Unexpected success message: {success_message}"
     
     def test_remember_me_functionality(self, login_page: LoginPage, context, page: Page):
@@ -81,32 +86,23 @@ class TestLogin:
         login_page.navigate_to_login()
         
         # Login with remember me checked
-        login_page.login_as_user("standard")
+        credentials = settings.get_user_credentials("standard")
+        login_page.login(
+            credentials["email"],
+            credentials["password"],
+            remember_me=True,
+            wait_for_url=login_page.DASHBOARD_URL,
+        )
         
         # Verify successful login
         assert login_page.is_logged_in(), "Login was not successful"
         
-        # Create a new page to simulate browser restart
-        new_page = context.new_page()
-        new_login_page = LoginPage(new_page)
-        
-        # Navigate to a protected page
-        new_login_page.navigate("dashboard")
-        
-        # The test should check if the user remains logged in,
-        # but since this is a mock test without an actual backend,
-        # we'll just check that we're redirected to login if cookies aren't preserved
-        try:
-            new_page.wait_for_url("**/login", timeout=5000)
-            # If we reach here, we've been redirected to login (no cookies preserved)
-            # In a real app with remember me, this would fail
-            assert False, "User was not remembered after creating a new page"
-        except:
-            # If we're not redirected to login, the test passes
-            pass
-        
-        # Cleanup
-        new_page.close()
+        # A remembered user gets a persistent session cookie; Playwright reports
+        # expires=-1 for cookies that only last until the browser is closed
+        cookies = context.cookies()
+        session_cookie = next((c for c in cookies if c["name"] in SESSION_COOKIE_NAMES), None)
+        assert session_cookie is not None, "No session cookie was set after login"
+        assert session_cookie["expires"] > 0, "User was not remembered: the session cookie expires with the browser"
         
     @pytest.mark.parametrize(
         "email,password,expected_error",
@@ -128,5 +124,5 @@ class TestLogin:
         # Verify error message contains expected text
         error_message = login_page.get_error_message()
         assert error_message, f"No error message displayed for email={email}, password={password}"
-        assert expected_error.lower() in error_message.lower(), \
+        assert contains_ci(error_message, expected_error), \
             f"Expected '{expected_error}' in error message, but got: '{error_message}'" 
\ No newline at end of file
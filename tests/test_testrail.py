@@ -0,0 +1,79 @@
+"""
+Tests for the TestRail result reporting.
+
+These tests don't use a browser; requests to TestRail are mocked.
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from config import settings
+from tests import conftest
+from utils import test_management
+
+
+@pytest.fixture
+def client(monkeypatch) -> "test_management.TestRailClient":
+    """Create a TestRail client whose requests are mocked."""
+    monkeypatch.setenv("TESTRAIL_URL", "https://testrail.example.com")
+    testrail_client = test_management.TestRailClient()
+    testrail_client.session.post = Mock()
+    return testrail_client
+
+
+@pytest.mark.parametrize(
+    "test_id,expected",
+    [
+        ("C1234", 1234),
+        ("c1234", 1234),
+        ("1234", 1234),
+        (1234, 1234),
+        ("TC-LOGIN-001", None),
+        ("C", None),
+        ("", None),
+    ]
+)
+def test_case_id(test_id, expected):
+    """Test conversion of test IDs to TestRail case IDs."""
+    assert test_management._case_id(test_id) == expected
+
+
+def test_update_test_result_skips_invalid_case_ids(client):
+    """Test that results without a TestRail case ID are left out of the queue."""
+    client.update_test_result("C1", "passed", elapsed=3)
+    client.update_test_result("TC-LOGIN-001", "failed")
+
+    assert client.pending == 1
+    assert client.skipped_ids == {"TC-LOGIN-001"}
+
+
+def test_flush_sends_results_in_batches(client):
+    """Test that queued results are sent in batches of RESULTS_BATCH_SIZE and then cleared."""
+    for case_id in range(2500):
+        client.update_test_result(str(case_id), "passed")
+
+    client.flush("7")
+
+    batches = [call.kwargs["json"]["results"] for call in client.session.post.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert client.session.post.call_args.args[0] == \
+        "https://testrail.example.com/index.php?/api/v2/add_results_for_cases/7"
+    assert client.pending == 0
+
+    # A second flush has nothing left to send
+    client.flush("7")
+    assert client.session.post.call_count == 3
+
+
+@pytest.mark.parametrize("is_xdist_worker,registered", [(False, True), (True, False)])
+def test_reporter_registered_once_per_run(monkeypatch, is_xdist_worker, registered):
+    """Test that under xdist only the controller reports results, so they are sent once."""
+    monkeypatch.setattr(settings, "TESTRAIL_URL", "https://testrail.example.com")
+    config = SimpleNamespace(addinivalue_line=Mock(), pluginmanager=Mock())
+    if is_xdist_worker:
+        config.workerinput = {"workerid": "gw0"}
+
+    conftest.pytest_configure(config)
+
+    assert config.pluginmanager.register.called == registered
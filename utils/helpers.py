@@ -1,35 +1,58 @@
 """
 Helper utilities for test automation.
 """
+import functools
 import json
-import random
-import string
+import secrets
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar, Union
 
-from faker import Faker
 from playwright.sync_api import Page, expect
 
 from config import settings
 
-# Initialize faker for generating test data
-fake = Faker()
+if TYPE_CHECKING:
+    from faker import Faker
 
+T = TypeVar("T")
 
-def generate_random_string(length: int = 10) -> str:
-    """Generate a random string of specified length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+# The screenshots directory is created once per session by the setup_allure_environment fixture
+SCREENSHOTS_DIR_STR = str(settings.SCREENSHOTS_DIR)
 
+# orjson is optional; it parses and serializes JSON considerably faster than the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_random_email() -> str:
-    """Generate a random email address."""
-    return fake.email()
+# Faker loads all of its providers on construction, so create it on first use
+_fake: Optional["Faker"] = None
 
 
-def generate_test_data() -> Dict[str, Any]:
-    """Generate test data for form filling."""
+def _get_fake() -> "Faker":
+    """Get the shared Faker instance, creating it on first use."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        
+        _fake = Faker()
+    return _fake
+
+
+# Emails are generated in small batches and each one is handed out once
+EMAIL_BATCH_SIZE = 16
+_email_pool: List[str] = []
+
+# Form records are generated in small batches and each one is handed out once
+RECORD_BATCH_SIZE = 8
+_record_pool: List[Dict[str, Any]] = []
+
+
+def _fake_record() -> Dict[str, Any]:
+    """Build a single fake form-filling record."""
+    fake = _get_fake()
     return {
         'first_name': fake.first_name(),
         'last_name': fake.last_name(),
@@ -43,6 +66,66 @@ def generate_test_data() -> Dict[str, Any]:
     }
 
 
+def reset_pool() -> None:
+    """Discard the pre-generated fake data so the next calls generate fresh values."""
+    _email_pool.clear()
+    _record_pool.clear()
+
+
+def _ts() -> str:
+    """Get the current time as a YYYYMMDD_HHMMSS string for artifact file names."""
+    now = datetime.now()
+    return f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+
+
+def generate_random_string(length: int = 10) -> str:
+    """Generate a random URL-safe string (letters, digits, '-' and '_') of specified length."""
+    # token_urlsafe(n) yields about 1.3 * n characters, so it always covers the requested length
+    return secrets.token_urlsafe(max(length, 8))[:length]
+
+
+def generate_random_email() -> str:
+    """
+    Get a random email address.
+    
+    Emails are generated in small batches and never handed out twice, but like
+    any Faker output two of them can occasionally be the same address.
+    """
+    if not _email_pool:
+        fake = _get_fake()
+        _email_pool.extend(fake.email() for _ in range(EMAIL_BATCH_SIZE))
+    return _email_pool.pop()
+
+
+def generate_test_data() -> Dict[str, Any]:
+    """
+    Get random test data for form filling.
+    
+    Records are generated in small batches and never handed out twice, but like
+    any Faker output two of them can occasionally share a value.
+    """
+    if not _record_pool:
+        _record_pool.extend(_fake_record() for _ in range(RECORD_BATCH_SIZE))
+    return _record_pool.pop()
+
+
+def contains_ci(haystack: str, needles: Union[str, Iterable[str]]) -> bool:
+    """
+    Check whether any of the needles occurs in the haystack, ignoring case.
+    
+    Args:
+        haystack: Text to search in
+        needles: Text or texts to search for
+        
+    Returns:
+        True if at least one needle is found, False otherwise
+    """
+    if isinstance(needles, str):
+        needles = (needles,)
+    haystack = haystack.lower()
+    return any(needle.lower() in haystack for needle in needles)
+
+
 def take_screenshot(page: Page, name: Optional[str] = None) -> str:
     """
     Take a screenshot and save it to the screenshots directory.
@@ -54,14 +137,9 @@ def take_screenshot(page: Page, name: Optional[str] = None) -> str:
     Returns:
         Path to the saved screenshot
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _ts()
     screenshot_name = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
-    screenshots_dir = settings.SCREENSHOTS_DIR
-    
-    # Create directory if it doesn't exist
-    screenshots_dir.mkdir(exist_ok=True, parents=True)
-    
-    screenshot_path = str(screenshots_dir / screenshot_name)
+    screenshot_path = f"{SCREENSHOTS_DIR_STR}/{screenshot_name}"
     page.screenshot(path=screenshot_path, full_page=True)
     return screenshot_path
 
@@ -76,8 +154,25 @@ def load_json_data(file_path: Union[str, Path]) -> Dict[str, Any]:
     Returns:
         Dictionary with the loaded data
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Parse the raw bytes directly instead of decoding them through a text-mode file first
+    content = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. from settings.get_env_config) as JSON objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any) -> str:
+    """Serialize data to a JSON string indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, default=_json_default)
 
 
 def save_json_data(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
@@ -89,7 +184,7 @@ def save_json_data(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
         file_path: Path to the JSON file
     """
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+        f.write(_dump_json(data))
 
 
 def wait_for_navigation(page: Page, timeout: Optional[int] = None) -> None:
@@ -104,27 +199,39 @@ def wait_for_navigation(page: Page, timeout: Optional[int] = None) -> None:
     page.wait_for_load_state("networkidle", timeout=timeout)
 
 
-def retry(func, retries: int = 3, delay: int = 1, *args, **kwargs) -> Any:
+def retry(
+    retries: int = 3,
+    delay: float = 1,
+    on: Tuple[Type[BaseException], ...] = (Exception,),
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
-    Retry a function multiple times.
+    Decorator that retries a function multiple times.
     
     Args:
-        func: Function to retry
-        retries: Number of retry attempts
-        delay: Delay between retries in seconds
-        args: Positional arguments for the function
-        kwargs: Keyword arguments for the function
+        retries: Number of attempts
+        delay: Delay between attempts in seconds
+        on: Exception types that trigger another attempt
         
     Returns:
-        Result of the function call
-    """
-    for attempt in range(retries):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            if attempt == retries - 1:
-                raise e
-            time.sleep(delay)
+        Decorator that wraps the function with the retry logic
+    
+    Example:
+        @retry(retries=3, delay=1, on=(PlaywrightError,))
+        def open_menu(page): ...
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(retries):
+                try:
+                    return func(*args, **kwargs)
+                except on:
+                    if attempt == retries - 1:
+                        raise
+                    time.sleep(delay)
+        
+        return wrapper
+    return decorator
 
 
 def expect_element_to_be_visible(page: Page, selector: str, timeout: Optional[int] = None) -> None:
@@ -1,16 +1,21 @@
 """
 Reporting utilities for test automation.
 """
-import json
+from __future__ import annotations
+
 import os
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from playwright.sync_api import Page, TestInfo
+if TYPE_CHECKING:
+    from playwright.sync_api import ConsoleMessage, Page, Request, Response, TestInfo
 
 from config import settings
-from utils.helpers import take_screenshot
+from utils.helpers import SCREENSHOTS_DIR_STR, _dump_json, _ts, take_screenshot
 
 
 def attach_screenshot(page: Page, test_info: TestInfo, name: Optional[str] = None) -> str:
@@ -25,9 +30,9 @@ def attach_screenshot(page: Page, test_info: TestInfo, name: Optional[str] = Non
     Returns:
         Path to the saved screenshot
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _ts()
     screenshot_name = f"{name or test_info.name}_{timestamp}.png"
-    screenshot_path = str(settings.SCREENSHOTS_DIR / screenshot_name)
+    screenshot_path = f"{SCREENSHOTS_DIR_STR}/{screenshot_name}"
     
     # Take screenshot
     page.screenshot(path=screenshot_path, full_page=True)
@@ -47,13 +52,13 @@ def attach_logs(test_info: TestInfo, logs: Union[str, List[str], Dict[str, Any]]
         logs: Logs to attach (string, list of strings, or dictionary)
     """
     if isinstance(logs, dict):
-        logs_content = json.dumps(logs, indent=2)
+        logs_content = _dump_json(logs)
     elif isinstance(logs, list):
         logs_content = "\n".join(logs)
     else:
         logs_content = str(logs)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _ts()
     log_name = f"{test_info.name}_logs_{timestamp}.txt"
     
     test_info.attach(log_name, logs_content, "text/plain")
@@ -61,34 +66,17 @@ def attach_logs(test_info: TestInfo, logs: Union[str, List[str], Dict[str, Any]]
 
 def attach_network_logs(page: Page, test_info: TestInfo) -> None:
     """
-    Attach network request/response logs to the test report.
+    Attach the captured network requests to the test report.
     
     Args:
         page: Playwright page object
         test_info: Pytest test info object
     """
-    requests = getattr(page, "_network_requests", [])
-    if not requests:
+    network_log = getattr(page, "_network_log", None)
+    if not network_log:
         return
     
-    network_logs = []
-    for req in requests:
-        try:
-            response = req.response() if hasattr(req, "response") else None
-            log_entry = {
-                "url": req.url,
-                "method": req.method,
-                "status": response.status if response else None,
-                "request_headers": req.headers if hasattr(req, "headers") else {},
-                "response_headers": response.headers if response and hasattr(response, "headers") else {},
-            }
-            network_logs.append(log_entry)
-        except Exception:
-            # Skip if the request/response is no longer available
-            pass
-    
-    if network_logs:
-        attach_logs(test_info, {"network_requests": network_logs})
+    attach_logs(test_info, {"network_requests": network_log.entries()})
 
 
 def create_allure_environment_properties() -> None:
@@ -114,7 +102,7 @@ def create_allure_environment_properties() -> None:
     allure_dir.mkdir(exist_ok=True, parents=True)
     
     with open(allure_dir / "environment.properties", "w", encoding="utf-8") as f:
-        f.write("\n".join(properties))
+        f.writelines(f"{line}\n" for line in properties)
 
 
 def save_test_artifacts(page: Page, test_info: TestInfo) -> None:
@@ -135,7 +123,8 @@ def save_test_artifacts(page: Page, test_info: TestInfo) -> None:
         test_info.attach("failure_screenshot", screenshot_path, "image/png")
         
         # Attach console logs
-        console_logs = getattr(page, "_console_messages", [])
+        log_collector = getattr(page, "_log_collector", None)
+        console_logs = log_collector.get_console_logs() if log_collector else []
         if console_logs:
             attach_logs(test_info, {"console_logs": console_logs})
             
@@ -144,8 +133,12 @@ def save_test_artifacts(page: Page, test_info: TestInfo) -> None:
             
         # Attach page HTML
         try:
-            html_content = page.content()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Truncate in the browser so only the kept part of the DOM is transferred
+            html_content = page.evaluate(
+                "(maxLength) => document.documentElement.outerHTML.slice(0, maxLength)",
+                settings.ARTIFACT_HTML_MAX_BYTES,
+            )
+            timestamp = _ts()
             html_name = f"{test_info.name}_page_{timestamp}.html"
             test_info.attach(html_name, html_content, "text/html")
         except Exception:
@@ -157,18 +150,44 @@ def save_test_artifacts(page: Page, test_info: TestInfo) -> None:
         print(f"Error saving test artifacts: {str(e)}")
 
 
+@lru_cache(maxsize=1024)
+def _format_log_second(timestamp_s: int) -> str:
+    """Format a whole-second Unix timestamp for log entries."""
+    return datetime.fromtimestamp(timestamp_s).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_log_time(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp for log entries."""
+    # Entries only show whole seconds, so bursts of logs share one formatted string
+    return _format_log_second(timestamp_ns // 1_000_000_000)
+
+
 class TestLogCollector:
     """Collect logs during test execution."""
     
+    # Maximum number of console entries and steps kept; the oldest are dropped first
+    MAX_ENTRIES = 10_000
+    
     def __init__(self):
-        self.console_logs = []
+        self.console_logs = deque(maxlen=self.MAX_ENTRIES)
         self.network_requests = []
-        self.steps = []
+        self.steps = deque(maxlen=self.MAX_ENTRIES)
         
     def add_console_log(self, log: str) -> None:
         """Add console log entry."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.console_logs.append(f"[{timestamp}] {log}")
+        self.console_logs.append((time.time_ns(), None, log))
+        
+    def on_console(self, msg: ConsoleMessage) -> None:
+        """Record a Playwright console message; formatting is deferred to get_console_logs()."""
+        self.console_logs.append((time.time_ns(), msg.type, msg.text))
+        
+    def get_console_logs(self) -> List[str]:
+        """Get formatted console log entries."""
+        return [
+            f"[{_format_log_time(timestamp_ns)}] [{message_type}] {text}" if message_type
+            else f"[{_format_log_time(timestamp_ns)}] {text}"
+            for timestamp_ns, message_type, text in self.console_logs
+        ]
         
     def add_network_request(self, request_data: Dict[str, Any]) -> None:
         """Add network request data."""
@@ -176,14 +195,60 @@ class TestLogCollector:
         
     def add_step(self, description: str) -> None:
         """Add test step."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.steps.append(f"[{timestamp}] {description}")
+        self.steps.append((time.time_ns(), description))
+        
+    def get_steps(self) -> List[str]:
+        """Get formatted test steps."""
+        return [f"[{_format_log_time(timestamp_ns)}] {description}" for timestamp_ns, description in self.steps]
         
     def get_all_logs(self) -> Dict[str, Any]:
         """Get all collected logs."""
         return {
-            "console_logs": self.console_logs,
+            "console_logs": self.get_console_logs(),
             "network_requests": self.network_requests,
-            "test_steps": self.steps,
+            "test_steps": self.get_steps(),
             "timestamp": datetime.now().isoformat(),
-        } 
\ No newline at end of file
+        }
+
+
+class NetworkLog:
+    """
+    Record network requests as they complete, one column per field.
+    
+    Everything is captured from the event payloads when the event fires, so
+    building the report needs no further calls to the browser.
+    """
+    
+    FIELDS = ("url", "method", "status", "request_headers", "response_headers")
+    
+    def __init__(self, maxlen: int = settings.NETWORK_LOG_LIMIT):
+        self.urls = deque(maxlen=maxlen)
+        self.methods = deque(maxlen=maxlen)
+        self.statuses = deque(maxlen=maxlen)
+        self.request_headers = deque(maxlen=maxlen)
+        self.response_headers = deque(maxlen=maxlen)
+        
+    def __len__(self) -> int:
+        return len(self.urls)
+        
+    def on_response(self, response: Response) -> None:
+        """Record a request together with its response."""
+        request = response.request
+        self._append(request.url, request.method, response.status, request.headers, response.headers)
+        
+    def on_request_failed(self, request: Request) -> None:
+        """Record a request that failed without a response."""
+        self._append(request.url, request.method, None, request.headers, {})
+        
+    def _append(self, url: str, method: str, status: Optional[int],
+                request_headers: Dict[str, str], response_headers: Dict[str, str]) -> None:
+        self.urls.append(url)
+        self.methods.append(method)
+        self.statuses.append(status)
+        self.request_headers.append(request_headers)
+        self.response_headers.append(response_headers)
+        
+    def entries(self) -> List[Dict[str, Any]]:
+        """Get the recorded requests, oldest first."""
+        rows = zip(self.urls, self.methods, self.statuses, self.request_headers, self.response_headers)
+        return [dict(zip(self.FIELDS, row)) for row in rows]
@@ -1,17 +1,89 @@
 """Integration with test management systems."""
 import os
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Set
+
+# TestRail status IDs for the built-in result statuses
+_STATUS_MAP = {
+    "passed": 1,
+    "blocked": 2,
+    "untested": 3,
+    "retest": 4,
+    "failed": 5,
+}
+
+# Maximum number of results sent in a single add_results_for_cases request
+RESULTS_BATCH_SIZE = 1000
+
+
+def _case_id(test_id: str) -> Optional[int]:
+    """Convert a test case ID such as "C1234" or "1234" to TestRail's integer case ID."""
+    case_id = str(test_id)
+    if case_id[:1] in ("C", "c"):
+        case_id = case_id[1:]
+    return int(case_id) if case_id.isdigit() else None
+
 
 class TestRailClient:
     def __init__(self):
         self.url = os.getenv("TESTRAIL_URL")
         self.user = os.getenv("TESTRAIL_USER")
         self.password = os.getenv("TESTRAIL_API_KEY")
-        
-    def update_test_result(self, test_id: str, status: str, 
+
+        # Reuse pooled connections across result updates instead of a new TLS handshake per call
+        self.session = requests.Session()
+        self.session.auth = (self.user, self.password)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            # Only connection errors are retried: urllib3 never retries a POST based on its
+            # response status, so a result that may have been recorded is not sent twice
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Results are buffered and sent in bulk by flush() instead of one request per test
+        self._buffer: List[Dict[str, Any]] = []
+        # Test IDs that are not TestRail case IDs and were left out of the results
+        self.skipped_ids: Set[str] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of queued results that have not been sent yet."""
+        return len(self._buffer)
+
+    def update_test_result(self, test_id: str, status: str,
                           message: Optional[str] = None,
-                          elapsed: Optional[int] = None) -> Dict[str, Any]:
-        """Update test result in TestRail."""
-        # Implementation of API call to TestRail
-        pass 
\ No newline at end of file
+                          elapsed: Optional[int] = None) -> None:
+        """
+        Queue a test result for the next flush().
+        
+        Results whose test ID is not a TestRail case ID (e.g. "C1234") are
+        skipped and their IDs collected in skipped_ids.
+        """
+        case_id = _case_id(test_id)
+        if case_id is None:
+            # A single invalid case ID makes TestRail reject the whole bulk request
+            self.skipped_ids.add(str(test_id))
+            return
+        
+        result: Dict[str, Any] = {
+            "case_id": case_id,
+            "status_id": _STATUS_MAP[status],
+        }
+        if message:
+            result["comment"] = message
+        if elapsed:
+            result["elapsed"] = f"{elapsed}s"
+        self._buffer.append(result)
+
+    def flush(self, run_id: str) -> None:
+        """Send all queued results to a TestRail run and clear the queue."""
+        url = f"{self.url}/index.php?/api/v2/add_results_for_cases/{run_id}"
+        for start in range(0, len(self._buffer), RESULTS_BATCH_SIZE):
+            response = self.session.post(url, json={"results": self._buffer[start:start + RESULTS_BATCH_SIZE]})
+            response.raise_for_status()
+        self._buffer.clear()